@@ -1,4 +1,5 @@
 import inspect
+from collections.abc import Callable
 from functools import lru_cache
 from types import UnionType
 from typing import Any, Union, get_args, get_origin
@@ -12,18 +13,20 @@ def _get_validate_method(typ: type) -> callable:  # pyright: ignore[reportGenera
     Handles both direct __validate__ and __validate__ on __origin__ (PEP 695 generics).
     """
     # Try direct __validate__ first
-    validate = getattr(typ, "__validate__", None)
-    if validate is not None:
-        return validate
+    try:
+        return typ.__validate__
+    except AttributeError:
+        pass
 
     # Try __validate__ on __origin__ for PEP 695 generic types
     origin = getattr(typ, "__origin__", None)
-    if origin is not None:
-        validate = getattr(origin, "__validate__", None)
-        if validate is not None:
-            return validate
+    if origin is None:
+        return None
 
-    return None
+    try:
+        return origin.__validate__
+    except AttributeError:
+        return None
 
 
 @lru_cache(maxsize=256)
@@ -31,6 +34,8 @@ def _get_type_info(typ: Any) -> tuple[Any, tuple[Any, ...]]:
     """
     Get origin and arguments for a typing annotation (cached).
 
+    Non-parameterized types are returned as ``(typ, ())``.
+
     This wraps ``typing.get_origin`` and ``typing.get_args`` which are
     relatively expensive on hot paths.
     """
@@ -40,14 +45,6 @@ def _get_type_info(typ: Any) -> tuple[Any, tuple[Any, ...]]:
     return origin, get_args(typ)
 
 
-@lru_cache(maxsize=128)
-def _get_origin_only(typ: Any) -> Any:
-    """
-    Fast origin lookup for a typing annotation (cached).
-    """
-    return get_origin(typ)
-
-
 def _check_simple_type(value: Any, typ: Any) -> bool:
     """Check a value against a non-parameterized (simple) type."""
     try:
@@ -65,8 +62,40 @@ def isinstance_typed_cached(value_type: Any, typ: Any) -> bool:
     return isinstance_typed(value_type, typ)
 
 
+@lru_cache(maxsize=256)
+def _get_instance_check(typ: Any) -> Callable[..., Any] | None:
+    """
+    Return a bound ``__instancecheck__`` for plain classes (cached).
+
+    The method is looked up on the metaclass, as ``isinstance`` does, so that
+    metaclasses such as ``type`` and classes defining ``__instancecheck__``
+    themselves are handled correctly.
+
+    Returns ``None`` for typing annotations that need the recursive check.
+    """
+    origin, args = _get_type_info(typ)
+    if isinstance(typ, type) and origin is typ and not args:
+        return type(typ).__instancecheck__.__get__(typ)
+    return None
+
+
+@lru_cache(maxsize=256)
+def _get_plain_union_types(args: tuple[Any, ...]) -> tuple[type, ...] | None:
+    """
+    Return union members as a tuple of classes when all of them are plain (cached).
+
+    Such unions can be checked with a single ``isinstance(value, types)`` call.
+    """
+    if all(_get_instance_check(t) is not None for t in args):
+        return args
+    return None
+
+
 def _check_union_type(value: Any, args: tuple[Any, ...]) -> bool:
     """Check a value against a ``Union`` type."""
+    plain_types = _get_plain_union_types(args)
+    if plain_types is not None:
+        return isinstance(value, plain_types)
     return any(isinstance_typed(value, t) for t in args)
 
 
@@ -79,6 +108,9 @@ def _check_list_type(value: Any, args: tuple[Any, ...]) -> bool:
         return True
 
     item_type = args[0]
+    check = _get_instance_check(item_type)
+    if check is not None:
+        return all(map(check, value))
     return all(isinstance_typed(item, item_type) for item in value)
 
 
@@ -91,6 +123,10 @@ def _check_dict_type(value: Any, args: tuple[Any, ...]) -> bool:
         return True
 
     key_type, val_type = args
+    key_check = _get_instance_check(key_type)
+    val_check = _get_instance_check(val_type)
+    if key_check is not None and val_check is not None:
+        return all(map(key_check, value.keys())) and all(map(val_check, value.values()))
     return all(isinstance_typed(k, key_type) and isinstance_typed(v, val_type) for k, v in value.items())
 
 
@@ -121,13 +157,11 @@ def isinstance_typed(value: Any, typ: Any) -> bool:
     - Collections (``list[T]``, ``dict[K, V]``, ``tuple[...]``).
     - Nested annotations.
     """
-    origin = _get_origin_only(typ)
+    origin, args = _get_type_info(typ)
 
-    if origin is None:
+    if origin is typ and not args:
         return _check_simple_type(value, typ)
 
-    origin, args = _get_type_info(typ)
-
     if origin is Union or origin is UnionType:
         return _check_union_type(value, args)
 
@@ -143,6 +177,37 @@ def isinstance_typed(value: Any, typ: Any) -> bool:
     return isinstance(value, origin)
 
 
+@lru_cache(maxsize=512)
+def _get_decoder(typ: Any) -> Callable[[Any], Any]:
+    """
+    Return a cached single-argument decoder for a type.
+
+    Types with a ``__validate__`` method are validated first and fall back to
+    calling the type itself; other types are simply called.
+
+    A raw value returned by ``__validate__`` is wrapped into the type only when
+    its exact type is one of the type's bases (e.g. ``int`` for ``Port(int)``),
+    so the wrap cannot change its meaning. Other results are returned as-is.
+    """
+    validate_method = _get_validate_method(typ)
+    if validate_method is None:
+        return typ
+
+    # Bases a raw result may be wrapped from; ``object`` would match anything
+    wrappable = frozenset(typ.__mro__[1:]) - {object} if isinstance(typ, type) else frozenset()
+
+    def decode(value: Any) -> Any:
+        try:
+            result = validate_method(value, typ)  # type: ignore[misc]
+        except (TypeError, ValueError):
+            return typ(value)  # type: ignore[call-arg]
+        if type(result) in wrappable:
+            return typ(result)  # type: ignore[call-arg]
+        return result
+
+    return decode
+
+
 # Cached set of simple types for the hot path in ``dec_hook``.
 _SIMPLE_TYPES = {int, str, float, bool, bytes, list, dict, tuple}
 
@@ -165,19 +230,16 @@ def dec_hook[M](typ: type[M], value: Any) -> M:
     Raises:
         TypeError: If conversion fails for all attempted strategies.
     """
+    # Already the exact target type: avoid rebuilding (and copying) it
+    if type(value) is typ:
+        return value
+
     if typ in _SIMPLE_TYPES:
         return typ(value)  # type: ignore[call-arg]
 
-    # Try __validate__ method (works for custom types and PEP 695 generics)
-    validate_method = _get_validate_method(typ)
-    if validate_method is not None:
-        try:
-            return validate_method(value, typ)  # type: ignore[misc]
-        except (TypeError, ValueError):
-            pass
-
+    # __validate__ (custom types and PEP 695 generics) or the type constructor
     try:
-        return typ(value)  # type: ignore[call-arg]
+        return _get_decoder(typ)(value)
     except (TypeError, ValueError) as e:
         error_msg = f"Cannot convert {type(value).__name__} to {typ}"
         raise TypeError(error_msg) from e
@@ -190,4 +252,6 @@ def clear_type_caches() -> None:
     Useful in tests or environments where type definitions change at runtime.
     """
     _get_type_info.cache_clear()
-    _get_origin_only.cache_clear()
+    _get_instance_check.cache_clear()
+    _get_plain_union_types.cache_clear()
+    _get_decoder.cache_clear()
@@ -1,4 +1,7 @@
+import inspect
 import json
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 
@@ -10,6 +13,39 @@ def _fallback_encode(obj: Any) -> str:
         return str(obj)
 
 
+def _encode_dynamic(obj: Any) -> Any:
+    """Call ``__encode__`` looked up on the object itself."""
+    encode_method = getattr(obj, "__encode__", None)
+    if callable(encode_method):
+        return encode_method()
+    return _fallback_encode(obj)
+
+
+def _has_dynamic_attributes(cls: type) -> bool:
+    """Return whether attribute lookup on instances is customised by the class."""
+    return inspect.getattr_static(cls, "__getattr__", None) is not None or inspect.isfunction(inspect.getattr_static(cls, "__getattribute__"))
+
+
+@lru_cache(maxsize=256)
+def _get_encoder(cls: type) -> Callable[[Any], Any] | None:
+    """
+    Return how instances of a class are encoded via ``__encode__`` (cached).
+
+    - A plain ``__encode__`` function on the class is returned as-is and called with the object.
+    - ``None`` means the class has no ``__encode__`` at all.
+    - Anything else (classmethods, staticmethods, ``__getattr__``) is looked up on each object.
+
+    As with other special methods, an ``__encode__`` set only on an instance is
+    honoured only for classes that customise attribute lookup.
+    """
+    encode_method = inspect.getattr_static(cls, "__encode__", None)
+    if inspect.isfunction(encode_method):
+        return encode_method
+    if encode_method is None and not _has_dynamic_attributes(cls):
+        return None
+    return _encode_dynamic
+
+
 def enc_hook(obj: Any) -> Any:
     """Encoding hook for object serialization.
 
@@ -19,10 +55,10 @@ def enc_hook(obj: Any) -> Any:
     Returns:
         JSON-compatible representation
     """
-    encode_method = getattr(obj, "__encode__", None)
-    if callable(encode_method):
+    encoder = _get_encoder(type(obj))
+    if encoder is not None:
         try:
-            return encode_method()
+            return encoder(obj)
         except (TypeError, ValueError):
             return _fallback_encode(obj)
 
@@ -1,80 +1,98 @@
 from collections.abc import Callable
+from functools import cache
 from typing import Any
 
 import msgspec
 
 from confstruct.hooks import dec_hook
 from confstruct.providers import ABCProvider, EnvProvider
-from confstruct.utils import get_field_defaults, get_required_field_names_lower, get_struct_fields
+from confstruct.utils import get_required_field_names_lower_set, get_struct_fields, to_bool
 
 
-def _convert_env_value(value: Any, field_type: Any) -> Any:  # noqa: PLR0911
+def _to_int(value: Any) -> Any:
+    """Parse an int, keeping the raw value for ``msgspec`` to report on failure."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def _to_float(value: Any) -> Any:
+    """Parse a float, keeping the raw value for ``msgspec`` to report on failure."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
+
+
+# Converters for environment strings; other field types are passed through as-is.
+_ENV_CONVERTERS: dict[Any, Callable[[Any], Any]] = {bool: to_bool, int: _to_int, float: _to_float}
+
+# Converters for ``get_all`` provider values, which may be any JSON type.
+# These are more lenient than msgspec's lax mode (e.g. 80.5 or " 80 " -> 80, 123 -> "123").
+_DATA_CONVERTERS: dict[Any, Callable[[Any], Any]] = {**_ENV_CONVERTERS, str: str}
+
+_MISSING = object()
+
+
+def _convert_env_value(value: Any, field_type: Any) -> Any:
     """Ultra-fast environment value conversion."""
     if not isinstance(value, str):
         return value
 
-    if field_type is bool:
-        v = value.lower()
-        return v in ("true", "1", "yes", "on")
+    convert = _ENV_CONVERTERS.get(field_type)
+    return value if convert is None else convert(value)
 
-    if field_type is int:
-        try:
-            return int(value)
-        except (ValueError, TypeError):
-            return value
 
-    if field_type is float:
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return value
+@cache
+def _env_convert_plan(obj: type) -> tuple[tuple[str, str, Callable[[str], Any] | None], ...]:
+    """
+    Return per-field ``(lower_name, name, converter)`` entries for environment values (cached).
 
-    if field_type is str:
-        return str(value)
+    ``converter`` is ``None`` for fields whose raw string is passed through.
+    """
+    return tuple((field.name.lower(), field.name, _ENV_CONVERTERS.get(field.type)) for field in get_struct_fields(obj))
 
-    return value
 
+@cache
+def _data_convert_plan(obj: type) -> tuple[tuple[str, str, Callable[[Any], Any] | None], ...]:
+    """
+    Return per-field ``(lower_name, encode_name, converter)`` entries for ``get_all`` data (cached).
 
-def _extreme_fast_json_load[M](obj: type[M], data: dict[str, Any]) -> M:
-    """Extreme-fast JSON loading with zero overhead."""
-    fields = get_struct_fields(obj)
-    required = set(get_required_field_names_lower(obj))
+    ``encode_name`` honours ``rename=``, as that is the key ``msgspec.convert`` expects.
+    """
+    return tuple((field.name.lower(), field.encode_name, _DATA_CONVERTERS.get(field.type)) for field in get_struct_fields(obj))
 
-    data_keys = set(data.keys())
 
-    if not required.issubset(data_keys):
-        missing = required - data_keys
+def _extreme_fast_json_load[M](
+    obj: type[M],
+    data: dict[str, Any],
+    dec_hook: Callable[[type, Any], Any] = dec_hook,
+    strict: bool = False,
+) -> M:
+    """Extreme-fast JSON loading: remap lowercase keys, then convert in ``msgspec``'s C core."""
+    required = get_required_field_names_lower_set(obj)
+    if not required.issubset(data):
+        missing = required - data.keys()
         raise ValueError(f"Required field {next(iter(missing))!r} not found")
 
-    kwargs = {}
-    get_field_defaults(obj)
-
-    for field in fields:
-        field_name = field.name
-        field_type = field.type
-        field_lower = field_name.lower()
-
-        if field_lower in data:
-            value = data[field_lower]
-
-            if field_type is int:
-                kwargs[field_name] = int(value)
-            elif field_type is float:
-                kwargs[field_name] = float(value)
-            elif field_type is str:
-                kwargs[field_name] = str(value)
-            elif field_type is bool:
-                v = str(value).lower()
-                kwargs[field_name] = v in ("true", "1", "yes", "on")
-            else:
-                try:
-                    kwargs[field_name] = dec_hook(field_type, value)
-                except Exception:  # noqa: BLE001
-                    kwargs[field_name] = value
-        elif field.default is not msgspec.NODEFAULT:
-            kwargs[field_name] = field.default
-
-    return obj(**kwargs)
+    plan = _data_convert_plan(obj)
+    if strict:
+        # Values must already have the field types; msgspec checks them as-is
+        remapped = {encode_name: data[field_lower] for field_lower, encode_name, _ in plan if field_lower in data}
+    else:
+        # Simple types are coerced up front, as msgspec's lax mode is stricter than the
+        # constructors (only "true"/"false"/"1"/"0" for bools, no float -> int, no int -> str)
+        remapped = {
+            encode_name: data[field_lower] if convert is None else convert(data[field_lower])
+            for field_lower, encode_name, convert in plan
+            if field_lower in data
+        }
+
+    try:
+        return msgspec.convert(remapped, obj, dec_hook=dec_hook, strict=strict)
+    except msgspec.ValidationError as e:
+        raise ValueError(f"Validation failed: {e}") from e
 
 
 def load[M](  # noqa: C901, PLR0912
@@ -82,33 +100,44 @@ def load[M](  # noqa: C901, PLR0912
     provider: ABCProvider | None = None,
     dec_hook: Callable[[type, Any], Any] = dec_hook,
     strict: bool = False,
+    raw_bytes: bool = False,
 ) -> M:
-    """Load configuration with extreme performance optimizations."""
+    """Load configuration with extreme performance optimizations.
+
+    With ``raw_bytes=True``, providers exposing ``get_bytes()`` (such as
+    ``JSONProvider``) have their raw JSON decoded straight into ``obj`` by
+    ``msgspec`` in a single pass. Keys are then matched exactly, without
+    lowercasing, so the struct's field names (or ``rename=``) must match them.
+    """
     provider = provider or EnvProvider()
 
+    if raw_bytes and hasattr(provider, "get_bytes"):
+        raw = provider.get_bytes()  # pyright: ignore[reportAttributeAccessIssue]
+        if raw is not None:
+            try:
+                return msgspec.json.decode(raw, type=obj, dec_hook=dec_hook, strict=strict)
+            except msgspec.ValidationError as e:
+                raise ValueError(f"Validation failed: {e}") from e
+
     if hasattr(provider, "get_all") and not isinstance(provider, EnvProvider):
         data = provider.get_all()  # pyright: ignore[reportAttributeAccessIssue]
-        return _extreme_fast_json_load(obj, data)
+        return _extreme_fast_json_load(obj, data, dec_hook, strict)
 
     if hasattr(provider, "get_all"):
         data = provider.get_all()  # pyright: ignore[reportAttributeAccessIssue]
 
-        required = set(get_required_field_names_lower(obj))
-        data_keys = set(data.keys())
-        if not required.issubset(data_keys):
-            missing = required - data_keys
+        required = get_required_field_names_lower_set(obj)
+        if not required.issubset(data):
+            missing = required - data.keys()
             raise ValueError(f"Required field {next(iter(missing))!r} not found")
 
         if isinstance(provider, EnvProvider):
-            fields = get_struct_fields(obj)
-            for field in fields:
-                field_lower = field.name.lower()
-                if field_lower in data:
-                    data[field.name] = _convert_env_value(data.pop(field_lower), field.type)
-                elif field.default is not msgspec.NODEFAULT:
-                    data[field.name] = field.default
-                else:
-                    data.pop(field_lower, None)
+            # Missing optional fields are left to msgspec, which applies their defaults
+            for field_lower, field_name, convert in _env_convert_plan(obj):
+                value = data.pop(field_lower, _MISSING)
+                if value is _MISSING:
+                    continue
+                data[field_name] = value if convert is None else convert(value)
 
     else:
         fields = get_struct_fields(obj)
@@ -1,5 +1,4 @@
 import os
-from typing import ClassVar
 
 from .abc import ABCProvider
 
@@ -8,13 +7,10 @@ class EnvProvider(ABCProvider):
     """
     High-performance environment variable provider with caching.
 
-    Environment values are read once and cached for subsequent lookups, which
-    makes it suitable for hot configuration paths.
+    Environment values are read once when the provider is created and cached
+    on the instance, which makes it suitable for hot configuration paths.
     """
 
-    _env_cache: ClassVar[dict[str, str] | None] = None
-    _env_cache_case_sensitive: ClassVar[bool] = True
-
     def __init__(self, prefix: str = "", case_sensitive: bool = False) -> None:
         """
         Create a new environment provider.
@@ -26,17 +22,12 @@ class EnvProvider(ABCProvider):
         self.prefix = prefix
         self.case_sensitive = case_sensitive
 
-        self._init_cache()
-
-    def _init_cache(self) -> None:
-        """Initialize or refresh the process-wide environment cache."""
-        if EnvProvider._env_cache is None or EnvProvider._env_cache_case_sensitive != self.case_sensitive:
-            if self.case_sensitive:
-                EnvProvider._env_cache = dict(os.environ)
-            else:
-                EnvProvider._env_cache = {k.upper(): v for k, v in os.environ.items()}
-
-            EnvProvider._env_cache_case_sensitive = self.case_sensitive
+        if case_sensitive:
+            self._key_prefix = prefix
+            self._env_cache = dict(os.environ)
+        else:
+            self._key_prefix = prefix.upper()
+            self._env_cache = {k.upper(): v for k, v in os.environ.items()}
 
     def get_value(self, key: str) -> str | None:
         """
@@ -48,12 +39,9 @@ class EnvProvider(ABCProvider):
         Returns:
             The value or ``None`` if not found.
         """
-        full_key = f"{self.prefix}{key}"
-
-        if not self.case_sensitive:
-            full_key = full_key.upper()
-
-        return EnvProvider._env_cache.get(full_key)  # type: ignore[union-attr]
+        if self.case_sensitive:
+            return self._env_cache.get(self._key_prefix + key)
+        return self._env_cache.get(self._key_prefix + key.upper())
 
     def get_values(self, keys: list[str]) -> dict[str, str | None]:
         """
@@ -65,7 +53,12 @@ class EnvProvider(ABCProvider):
         Returns:
             Mapping from key to value (or ``None`` if missing).
         """
-        return {key: self.get_value(key) for key in keys}
+        cache = self._env_cache
+        prefix = self._key_prefix
+
+        if self.case_sensitive:
+            return {key: cache.get(prefix + key) for key in keys}
+        return {key: cache.get(prefix + key.upper()) for key in keys}
 
     def get_all(self) -> dict[str, str]:
         """Get all environment variables as a normalized dictionary.
@@ -76,20 +69,12 @@ class EnvProvider(ABCProvider):
         Returns:
             Dictionary with lowercase keys mapping to environment variable values.
         """
-        cache = EnvProvider._env_cache
-        if cache is None:
-            return {}
-
-        if self.case_sensitive:
-            return {k.lower(): v for k, v in cache.items()}
-        else:
-            return {k.lower(): v for k, v in cache.items()}
+        return {k.lower(): v for k, v in self._env_cache.items()}
 
     @classmethod
     def clear_cache(cls) -> None:
-        """Clear the internal environment cache.
+        """Kept for backward compatibility; there is no shared cache to clear.
 
-        Primarily useful in tests.
+        Each provider snapshots the environment when it is created, so a new
+        provider picks up environment changes.
         """
-        cls._env_cache = None
-        cls._env_cache_case_sensitive = True
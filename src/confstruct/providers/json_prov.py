@@ -16,11 +16,14 @@ class JSONProvider(ABCProvider):
     - Pre-computed lookups
     """
 
-    _cache: ClassVar[dict[str, dict[str, Any]]] = {}
+    # File cache keyed by (resolved path, mtime_ns, size), so edited files are re-read
+    _cache: ClassVar[dict[tuple[str, int, int], tuple[bytes, dict[str, Any]]]] = {}
+    _cache_maxsize: ClassVar[int] = 32
 
     def __init__(self, value: dict[str, Any] | bytes | str | Path) -> None:
         """Initialize provider from JSON data."""
-        self._cache_key: str | None = None
+        self._cache_key: tuple[str, int, int] | None = None
+        self._raw_bytes: bytes | bytearray | memoryview | None = None
 
         if isinstance(value, dict):
             self._normalized = self._normalize_dict_single_pass(value)
@@ -29,11 +32,12 @@ class JSONProvider(ABCProvider):
         path = None
         if isinstance(value, (str, Path)):
             path = Path(value) if isinstance(value, str) else value
-            self._cache_key = str(path)
+            stat = path.stat()
+            self._cache_key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
 
             cached = self._cache.get(self._cache_key)
             if cached is not None:
-                self._normalized = cached
+                self._raw_bytes, self._normalized = cached
                 return
 
             with path.open("rb") as f:
@@ -44,32 +48,29 @@ class JSONProvider(ABCProvider):
             raw_data = value
 
         if isinstance(raw_data, (bytes, bytearray, memoryview)):
+            self._raw_bytes = raw_data
             data = msgspec.json.decode(raw_data)
         else:
             data = raw_data
 
         self._normalized = self._normalize_dict_single_pass(data)
         if self._cache_key is not None:
-            self._cache[self._cache_key] = self._normalized
+            cache = self._cache
+            if len(cache) >= self._cache_maxsize:
+                # Evict the oldest entry (dicts keep insertion order)
+                del cache[next(iter(cache))]
+            cache[self._cache_key] = (raw_data, self._normalized)
 
     def _normalize_dict_single_pass(self, data: dict[str, Any]) -> dict[str, Any]:
         """Single-pass extreme normalization."""
-        if not data:
+        if all(type(k) is str and k.islower() for k in data):
             return data
 
-        first_key = next(iter(data))
-        if isinstance(first_key, str) and first_key.islower():
-            return data
-
-        result = {}
-        for k, v in data.items():
-            key_str = str(k)
-            if key_str.islower():
-                result_key = key_str
-            else:
-                result_key = key_str.lower()
-            result[result_key] = v
-        return result
+        normalized = {}
+        for raw_key, value in data.items():
+            key = str(raw_key)
+            normalized[key if key.islower() else key.lower()] = value
+        return normalized
 
     def get_value(self, key: str) -> Any | None:
         """Get value by key (case-insensitive)."""
@@ -78,3 +79,7 @@ class JSONProvider(ABCProvider):
     def get_all(self) -> dict[str, Any]:
         """Return normalized mapping."""
         return self._normalized
+
+    def get_bytes(self) -> bytes | bytearray | memoryview | None:
+        """Return the raw JSON document, or ``None`` if created from a dict."""
+        return self._raw_bytes
@@ -1,7 +1,126 @@
-import json
-from typing import Any, TypeVar, get_args
+import re
+from functools import lru_cache
+from typing import Any, get_args
 
-T = TypeVar("T")
+import msgspec
+
+from confstruct.utils import to_bool
+
+# Comma-separated numeric strings longer than this are parsed in bulk.
+_BULK_PARSE_MIN_LENGTH = 64
+
+# Item types converted by ListOf, and the subset that is bulk-parsed.
+_SIMPLE_TYPES = frozenset({int, str, float, bool})
+_NUMERIC_TYPES = frozenset({int, float})
+
+# "[" followed by something that can start a JSON value (or "]"). Strings like
+# "[a, b]" fail this and skip the JSON parser, which would reject them anyway.
+_JSON_LIST_START = re.compile(r"\[\s*[-\"0-9\[\]{tfn]")
+
+
+
+def _item_to_bool(item: Any) -> bool:
+    """Convert a list item to bool: strings by their spelling (as for bool fields), anything else by truthiness."""
+    return to_bool(item) if isinstance(item, str) else bool(item)
+
+
+# Per-item converters for the simple item types.
+_ITEM_CONVERTERS = {int: int, float: float, str: str, bool: _item_to_bool}
+
+
+@lru_cache(maxsize=32)
+def _get_list_decoder(inner_type: type) -> msgspec.json.Decoder:
+    """Return a cached strict JSON decoder for ``list[inner_type]``."""
+    return msgspec.json.Decoder(list[inner_type])
+
+
+def _bulk_parse_csv(value: str, inner_type: type) -> list | None:
+    """
+    Parse a comma-separated list of numbers in a single C-level pass.
+
+    The string is decoded by ``msgspec`` as the body of a JSON array.
+    Returns ``None`` when that is not possible (empty items, ``inf``,
+    leading zeros, ...), so the caller can fall back to per-item parsing.
+    """
+    try:
+        return _get_list_decoder(inner_type).decode(f"[{value}]") or None
+    except msgspec.DecodeError:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _inner_of(typ: Any) -> Any:
+    """Return the item type of a ``list[T]``-style annotation, or ``None`` (cached)."""
+    args = get_args(typ)
+    return args[0] if args else None
+
+
+def _convert_items(items: list, inner_type: type) -> list | None:
+    """
+    Convert every item to ``inner_type`` with the same per-item rule.
+
+    Returns ``None`` if any item cannot be converted.
+    """
+    try:
+        return list(map(_ITEM_CONVERTERS[inner_type], items))
+    except (TypeError, ValueError):
+        return None
+
+
+def _validate_list(cls: type[list], value: list, inner_type: Any) -> list:
+    """Convert the items of a real list to ``inner_type`` when it is a simple type."""
+    if inner_type in _SIMPLE_TYPES:
+        # Already typed (exact type check, so bools are still converted for int)
+        if all(type(item) is inner_type for item in value):
+            return cls(value)
+
+        converted = _convert_items(value, inner_type)
+        if converted is not None:
+            return cls(converted)
+    return cls(value)
+
+
+def _validate_str(cls: type[list], value: str, inner_type: Any) -> Any:  # noqa: C901
+    """Parse a JSON-style or comma-separated list string."""
+    if value[:1] == "[" and value[-1:] == "]" and _JSON_LIST_START.match(value):
+        try:
+            if inner_type in _SIMPLE_TYPES:
+                try:
+                    # Already-typed items are parsed and checked in a single pass (strict decode)
+                    return cls(_get_list_decoder(inner_type).decode(value))
+                except msgspec.ValidationError:
+                    pass
+
+            parsed = msgspec.json.decode(value)
+            if isinstance(parsed, list):
+                return _validate_list(cls, parsed, inner_type)
+        except msgspec.DecodeError:
+            pass
+
+    if len(value) > _BULK_PARSE_MIN_LENGTH and inner_type in _NUMERIC_TYPES:
+        parsed = _bulk_parse_csv(value, inner_type)
+        if parsed is not None:
+            return cls(parsed)
+
+    if "," in value:
+        items = list(filter(None, map(str.strip, value.split(","))))
+    else:
+        # Single item: skip the split/filter machinery
+        item = value.strip()
+        items = [item] if item else []
+
+    if not items:
+        return value
+
+    if inner_type in _SIMPLE_TYPES:
+        converted = _convert_items(items, inner_type)
+        if converted is not None:
+            return cls(converted)
+    return cls(items)
+
+
+# Handlers for the exact runtime type of the incoming value.
+_VALIDATORS = {list: _validate_list, str: _validate_str}
 
 
 class ListOf(list):
@@ -21,7 +140,7 @@ class ListOf(list):
         return cls
 
     @classmethod
-    def __validate__(cls, value: Any, typ: Any):  # noqa: C901
+    def __validate__(cls, value: Any, typ: Any):
         """Validation hook used by ``dec_hook`` / ``msgspec``.
 
         Attempts to coerce the input into a ``ListOf[T]`` according to the
@@ -30,47 +149,20 @@ class ListOf(list):
         if isinstance(value, cls):
             # Already a ListOf, return as-is
             return value
-            
-        if isinstance(value, list):
-            args = get_args(typ)
-            converted = []
-            if args:
-                inner_type = args[0]
-
-                if inner_type in (int, str, float, bool):
-                    try:
-                        converted = [inner_type(item) for item in value]
-                    except (TypeError, ValueError):
-                        converted = value
-                else:
-                    converted = value
-            else:
-                converted = value
-            
-            return cls(converted)
 
+        inner_type = _inner_of(typ)
+
+        handler = _VALIDATORS.get(type(value))
+        if handler is not None:
+            return handler(cls, value, inner_type)
+
+        # Subclasses of list / str miss the exact-type table
+        if isinstance(value, list):
+            return _validate_list(cls, value, inner_type)
         if isinstance(value, str):
-            if value.startswith("[") and value.endswith("]"):
-                try:
-                    parsed = json.loads(value)
-                    if isinstance(parsed, list):
-                        return cls.__validate__(parsed, typ)
-                except json.JSONDecodeError:
-                    pass
+            return _validate_str(cls, value, inner_type)
 
-            items = [item.strip() for item in value.split(",") if item.strip()]
-            if items:
-                args = get_args(typ)
-                if args:
-                    inner_type = args[0]
-                    if inner_type in (int, str):
-                        try:
-                            return cls([inner_type(item) for item in items])
-                        except (TypeError, ValueError):
-                            pass
-                return cls(items)
-
-        return cls(value) if isinstance(value, list) else value
+        return value
 
     @classmethod
     def __mspec_decode__(cls, value: Any, typ: Any):
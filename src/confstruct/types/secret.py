@@ -1,4 +1,6 @@
-from functools import lru_cache
+# Fixed-length mask: masked output never reveals the secret's length.
+_MASK = "***"
+_MASKED_REPR = f"SecretStr('{_MASK}')"
 
 
 class SecretStr:
@@ -6,8 +8,8 @@ class SecretStr:
     Lightweight secret string wrapper.
 
     The underlying value is stored as a plain string, but string
-    representation is always masked. This type is designed to be
-    extremely cheap to construct and copy.
+    representation is always masked with a constant ``***``. This type is
+    designed to be extremely cheap to construct and copy.
     """
 
     __slots__ = ("_value",)
@@ -15,16 +17,6 @@ class SecretStr:
     def __init__(self, value: str) -> None:
         self._value = str(value)
 
-    @classmethod
-    @lru_cache(maxsize=128)
-    def _get_validate_method(cls):
-        """Cached accessor for the ``__validate__`` method.
-
-        Used by the generic ``dec_hook`` to speed up repeated
-        validations for the same type.
-        """
-        return cls.__validate__
-
     @classmethod
     def __validate__(cls, value, typ):
         """Validation hook used by ``dec_hook`` / ``msgspec``.
@@ -40,10 +32,10 @@ class SecretStr:
         return cls(str(value))
 
     def __str__(self) -> str:
-        return "***"
+        return _MASK
 
     def __repr__(self) -> str:
-        return "SecretStr('***')"
+        return _MASKED_REPR
 
     @property
     def value(self) -> str:
@@ -1,23 +1,58 @@
-from functools import lru_cache
-from typing import Any
+from collections.abc import Mapping
+from functools import cache
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
 import msgspec
 
+# Truthy spellings for boolean values; common casings are listed so that
+# most inputs match without allocating a lowercased copy.
+_BOOL_TRUE = frozenset({"true", "1", "yes", "on", "TRUE", "True", "YES", "Yes", "ON", "On"})
+
+
+class _StructInfo(NamedTuple):
+    """Field metadata collected for a struct type."""
+
+    fields: tuple[msgspec.structs.FieldInfo, ...]
+    required_lower: tuple[str, ...]
+    required_lower_set: frozenset[str]
+    defaults: Mapping[str, Any]
+
+
+@cache
+def _get_struct_info(obj_type: type) -> _StructInfo:
+    """Collect fields, required names and defaults with a single ``fields()`` call (cached)."""
+    fields = msgspec.structs.fields(obj_type)
+    required_lower = tuple(field.name.lower() for field in fields if field.default is msgspec.NODEFAULT)
+    return _StructInfo(
+        fields=fields,
+        required_lower=required_lower,
+        required_lower_set=frozenset(required_lower),
+        defaults=MappingProxyType({field.name: field.default for field in fields if field.default is not msgspec.NODEFAULT}),
+    )
+
 
-@lru_cache(maxsize=128)
 def get_struct_fields(obj_type: type) -> tuple[msgspec.structs.FieldInfo, ...]:
     """Return msgspec struct fields for the given type (cached)."""
-    return msgspec.structs.fields(obj_type)
+    return _get_struct_info(obj_type).fields
 
 
-@lru_cache(maxsize=128)
 def get_required_field_names_lower(obj_type: type) -> tuple[str, ...]:
     """Return lowercase names of all required fields for the given struct type."""
-    return tuple(field.name.lower() for field in get_struct_fields(obj_type) if field.default is msgspec.NODEFAULT)
+    return _get_struct_info(obj_type).required_lower
+
+
+def get_required_field_names_lower_set(obj_type: type) -> frozenset[str]:
+    """Return lowercase names of all required fields as a frozenset, for O(1) membership checks."""
+    return _get_struct_info(obj_type).required_lower_set
+
+
+def get_field_defaults(obj_type: type) -> Mapping[str, Any]:
+    """Return a read-only mapping of field names to their default values (cached)."""
+    return _get_struct_info(obj_type).defaults
 
 
-@lru_cache(maxsize=128)
-def get_field_defaults(obj_type: type) -> dict[str, Any]:
-    """Return mapping of field names to their default values (cached)."""
-    fields = get_struct_fields(obj_type)
-    return {field.name: field.default for field in fields if field.default is not msgspec.NODEFAULT}
+def to_bool(value: Any) -> bool:
+    """Interpret a value as a boolean flag (``"true"``, ``"1"``, ``"yes"`` or ``"on"``, in any case)."""
+    value = str(value)
+    return value in _BOOL_TRUE or value.lower() in _BOOL_TRUE
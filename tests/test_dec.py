@@ -0,0 +1,48 @@
+from abc import ABC
+
+from confstruct.hooks.dec import dec_hook, isinstance_typed
+from confstruct.types import ListOf
+
+
+class _Base(ABC):  # noqa: B024
+    pass
+
+
+class _Registered:
+    pass
+
+
+_Base.register(_Registered)
+
+
+class _Meta(type):
+    def __instancecheck__(cls, instance: object) -> bool:
+        return instance == "match"
+
+
+class _Custom(metaclass=_Meta):
+    pass
+
+
+def test_list_of_metaclass_items() -> None:
+    assert isinstance_typed([int, str], list[type])
+    assert not isinstance_typed([int, 1], list[type])
+
+
+def test_dict_of_metaclass_values() -> None:
+    assert isinstance_typed({"a": int}, dict[str, type])
+    assert not isinstance_typed({"a": 1}, dict[str, type])
+
+
+def test_custom_instancecheck_is_honoured() -> None:
+    assert isinstance_typed(["match"], list[_Custom])
+    assert not isinstance_typed(["other"], list[_Custom])
+
+
+def test_abc_registration_is_honoured() -> None:
+    assert isinstance_typed([_Registered()], list[_Base])
+    assert isinstance_typed(_Registered(), int | _Base)
+
+
+def test_dec_hook_keeps_unparseable_list_value() -> None:
+    assert dec_hook(ListOf, 5) == 5
@@ -0,0 +1,49 @@
+from typing import Any
+
+from confstruct.hooks.enc import enc_hook
+
+
+class _Method:
+    def __encode__(self) -> str:
+        return "method"
+
+
+class _Inherited(_Method):
+    pass
+
+
+class _ClassMethod:
+    @classmethod
+    def __encode__(cls) -> str:
+        return "classmethod"
+
+
+class _StaticMethod:
+    @staticmethod
+    def __encode__() -> str:
+        return "staticmethod"
+
+
+class _GetAttr:
+    def __getattr__(self, name: str) -> Any:
+        if name == "__encode__":
+            return lambda: "getattr"
+        raise AttributeError(name)
+
+
+class _Plain:
+    def __str__(self) -> str:
+        return "plain"
+
+
+def test_encode_method_kinds() -> None:
+    assert enc_hook(_Method()) == "method"
+    assert enc_hook(_Inherited()) == "method"
+    assert enc_hook(_ClassMethod()) == "classmethod"
+    assert enc_hook(_StaticMethod()) == "staticmethod"
+    assert enc_hook(_GetAttr()) == "getattr"
+
+
+def test_fallback_without_encode() -> None:
+    assert enc_hook(_Plain()) == "plain"
+    assert enc_hook(3) == "3"
@@ -0,0 +1,18 @@
+from confstruct.types import ListOf
+
+
+def test_bool_items_from_strings_use_spellings() -> None:
+    assert ListOf.__validate__(["false", "no"], list[bool]) == [False, False]
+    assert ListOf.__validate__(["yes", "On"], list[bool]) == [True, True]
+    assert ListOf.__validate__('["false", "no"]', list[bool]) == [False, False]
+
+
+def test_bool_items_from_non_strings_use_truthiness() -> None:
+    assert ListOf.__validate__([2, 1.0, 0], list[bool]) == [True, True, False]
+    assert ListOf.__validate__("[2, 1, 0]", list[bool]) == [True, True, False]
+    assert ListOf.__validate__([True, False], list[bool]) == [True, False]
+
+
+def test_comma_separated_bools() -> None:
+    assert ListOf.__validate__("true, no,ON", list[bool]) == [True, False, True]
+    assert ListOf.__validate__("false", list[bool]) == [False]
@@ -0,0 +1,93 @@
+from typing import Any
+
+import msgspec
+import pytest
+
+from confstruct import load
+from confstruct.providers import EnvProvider, JSONProvider
+from confstruct.types import ListOf
+
+
+class Port(int):
+    @classmethod
+    def __validate__(cls, value: Any, typ: Any) -> int:
+        port = int(value)
+        if not 1 <= port <= 65535:
+            raise ValueError(f"Port must be between 1 and 65535, got {port}")
+        return port
+
+
+class _PortConfig(msgspec.Struct):
+    port: Port
+
+
+class _HostsConfig(msgspec.Struct):
+    hosts: ListOf[str]
+
+
+def test_raw_validate_result_is_wrapped() -> None:
+    config = load(_PortConfig, JSONProvider({"port": "8000"}))
+    assert config.port == 8000
+    assert type(config.port) is Port
+
+
+@pytest.mark.parametrize("hosts", [{"k": 1}, "   "])
+def test_unparseable_list_is_rejected(hosts: Any) -> None:
+    with pytest.raises(ValueError, match="Validation failed"):
+        load(_HostsConfig, JSONProvider({"hosts": hosts}))
+
+
+def test_whitespace_env_list_is_rejected(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("HOSTS", "   ")
+    with pytest.raises(ValueError, match="Validation failed"):
+        load(_HostsConfig, EnvProvider())
+
+
+class _Simple(msgspec.Struct):
+    name: str = ""
+    port: int = 0
+    ratio: float = 1.0
+    debug: bool = False
+
+
+class _Renamed(msgspec.Struct, rename="camel"):
+    db_host: str
+    max_conn: int = 1
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        ({"name": 123}, _Simple(name="123")),
+        ({"port": 80.5}, _Simple(port=80)),
+        ({"port": " 80 "}, _Simple(port=80)),
+        ({"ratio": "2.5"}, _Simple(ratio=2.5)),
+        ({"debug": "yes"}, _Simple(debug=True)),
+        ({"DEBUG": "off"}, _Simple(debug=False)),
+    ],
+)
+def test_json_values_are_coerced(data: dict[str, Any], expected: _Simple) -> None:
+    assert load(_Simple, JSONProvider(data)) == expected
+
+
+def test_json_keys_match_renamed_fields() -> None:
+    assert load(_Renamed, JSONProvider({"DB_HOST": "h", "max_conn": "5"})) == _Renamed(db_host="h", max_conn=5)
+
+
+def test_json_missing_required_field() -> None:
+    with pytest.raises(ValueError, match="Required field 'db_host' not found"):
+        load(_Renamed, JSONProvider({"max_conn": 5}))
+
+
+def test_json_strict_skips_coercion() -> None:
+    assert load(_Simple, JSONProvider({"port": 5}), strict=True) == _Simple(port=5)
+    with pytest.raises(ValueError, match="Validation failed"):
+        load(_Simple, JSONProvider({"port": "5"}), strict=True)
+
+
+def test_env_values_are_converted(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("NAME", "svc")
+    monkeypatch.setenv("PORT", "8080")
+    monkeypatch.setenv("RATIO", "0.5")
+    monkeypatch.setenv("DEBUG", "On")
+    assert load(_Simple, EnvProvider()) == _Simple(name="svc", port=8080, ratio=0.5, debug=True)